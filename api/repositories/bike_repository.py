@@ -1,6 +1,5 @@
 from sqlalchemy import and_, extract, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from shared.models import BikeModel, StationModel
 
@@ -31,24 +30,28 @@ class SQLAlchemyBikeRepository(BikeRepository):
         result = await self.session.execute(statement)
         return result.all()
 
+    def _get_bike_positions_statement(self):
+        # Only the columns needed for distances, fetched in a single join
+        # instead of hydrating every BikeModel and its station relationship
+        return select(BikeModel.number, StationModel.lat, StationModel.lng).outerjoin(
+            StationModel
+        )
+
     async def get_all_bikes(self):
-        statement = (
-            select(BikeModel)
-            .options(selectinload(BikeModel.station))
-            .order_by(BikeModel.number, BikeModel.timestamp)
+        statement = self._get_bike_positions_statement().order_by(
+            BikeModel.number, BikeModel.timestamp
         )
         result = await self.session.execute(statement)
-        return result.scalars().all()
+        return result.all()
 
     async def get_bikes_by_number(self, bike_number: str):
         statement = (
-            select(BikeModel)
-            .options(selectinload(BikeModel.station))
+            self._get_bike_positions_statement()
             .where(BikeModel.number == bike_number)
             .order_by(BikeModel.timestamp)
         )
         result = await self.session.execute(statement)
-        return result.scalars().all()
+        return result.all()
 
     async def get_station_arrival_counts(self):
         earliest_logs = self._get_earliest_logs_subquery()
@@ -15,11 +15,23 @@ class DistanceCalculatorService(DistanceService):
         bikes = await self.repository.get_all_bikes()
         positions = group_bike_positions(bikes)
 
+        bike_groups = [
+            (bike_number, bike_group)
+            for bike_number, bike_group in positions.items()
+            if len(bike_group) >= 2
+        ]
+        distances = self._calculate_distances(
+            [self._get_points(bike_group) for _, bike_group in bike_groups]
+        )
+
         return sorted(
             [
-                self._create_distance_response(bike_number, bike_group)
-                for bike_number, bike_group in positions.items()
-                if len(bike_group) >= 2
+                DistanceResponse(
+                    bike_number=bike_number,
+                    total_distance=distance,
+                    travels=len(bike_group) - 1,
+                )
+                for (bike_number, bike_group), distance in zip(bike_groups, distances)
             ],
             key=lambda r: -r.total_distance,
         )
@@ -29,24 +41,34 @@ class DistanceCalculatorService(DistanceService):
         if not bikes:
             return None
 
-        return self._create_distance_response(bike_number, bikes)
-
-    def _create_distance_response(
-        self, bike_number: str, bike_group
-    ) -> DistanceResponse:
-        points = [(b.station.lat, b.station.lng) for b in bike_group if b.station]
+        (distance,) = self._calculate_distances([self._get_points(bikes)])
         return DistanceResponse(
             bike_number=bike_number,
-            total_distance=self._calculate_distance(points),
-            travels=len(bike_group) - 1,
+            total_distance=distance,
+            travels=len(bikes) - 1,
         )
 
     @staticmethod
-    def _calculate_distance(points: list[tuple[float, float]]) -> float:
-        if len(points) < 2:
-            return 0.0
-
-        start = np.array(points[:-1])
-        end = np.array(points[1:])
-        distances = haversine_vector(start, end, unit=Unit.KILOMETERS)
-        return round(np.sum(distances), 2)
+    def _get_points(bike_group) -> list[tuple[float, float]]:
+        return [(b.lat, b.lng) for b in bike_group if b.lat is not None]
+
+    @staticmethod
+    def _calculate_distances(
+        point_groups: list[list[tuple[float, float]]],
+    ) -> list[float]:
+        # Legs of every group are measured in a single haversine_vector call,
+        # then summed back per group by their group index
+        starts, ends, owners = [], [], []
+        for index, points in enumerate(point_groups):
+            starts.extend(points[:-1])
+            ends.extend(points[1:])
+            owners.extend([index] * max(len(points) - 1, 0))
+
+        if not starts:
+            return [0.0] * len(point_groups)
+
+        distances = haversine_vector(
+            np.array(starts), np.array(ends), unit=Unit.KILOMETERS
+        )
+        totals = np.bincount(owners, weights=distances, minlength=len(point_groups))
+        return [round(float(total), 2) for total in totals]
@@ -17,7 +17,7 @@ class DistributionAnalysisService(DistributionService):
         station_counts = await self.repository.get_station_arrival_counts()
         return sorted(
             [
-                StationArrivalCountResponse(
+                StationArrivalCountResponse.model_construct(
                     station_name=station.name,
                     latitude=station.lat,
                     longitude=station.lng,
@@ -31,7 +31,7 @@ class DistributionAnalysisService(DistributionService):
     async def get_distribution_by_hour(self) -> list[ArrivalCountByHourResponse]:
         hourly_counts = await self.repository.get_arrival_count_by_hour()
         return [
-            ArrivalCountByHourResponse(
+            ArrivalCountByHourResponse.model_construct(
                 time=time(hour=int(hour)),
                 arrival_count=count,
             )
@@ -45,7 +45,7 @@ class DistributionAnalysisService(DistributionService):
             await self.repository.get_hour_and_station_arrival_counts()
         )
         return [
-            HourAndStationArrivalCountResponse(
+            HourAndStationArrivalCountResponse.model_construct(
                 time=time(hour=int(hour)),
                 station_name=station_name,
                 latitude=latitude,
@@ -14,8 +14,9 @@ class HistoryQueryService(HistoryService):
 
         return HistoryResponse(
             bike_number=bike_number,
+            # Rows come from our own database, so they are not validated again
             history=[
-                HistoryElement(
+                HistoryElement.model_construct(
                     station_name=station.name,
                     latitude=station.lat,
                     longitude=station.lng,
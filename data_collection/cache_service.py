@@ -16,7 +16,7 @@ class CacheService:
             async with AsyncSessionLocal() as session:
                 await self._fetch_data(session)
         except Exception as e:
-            logger.error(f"Error in CacheService.fetch: {e}", exc_info=True)
+            logger.error("Error in CacheService.fetch: %s", e, exc_info=True)
 
     async def _fetch_data(self, session: AsyncSession):
         stations = await self._fetch_stations(session)
@@ -3,6 +3,8 @@ import os
 from datetime import UTC, datetime
 
 import httpx
+from sqlalchemy import insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from shared.database import AsyncSessionLocal, wait_for_db
@@ -19,11 +21,11 @@ API_URL = os.getenv("API_URL")
 cache_service = CacheService()
 
 
-def extract_relevant_data(raw_data: dict) -> list[StationSchema]:
+def extract_relevant_data(raw_data: bytes) -> list[StationSchema]:
     # I only query data for Budapest
     # The response will only have 1 country (Hungary)
     # And 1 city (Budapest)
-    data = ApiResponse.model_validate(raw_data)
+    data = ApiResponse.model_validate_json(raw_data)
     return data.countries[0].cities[0].places
 
 
@@ -31,47 +33,45 @@ async def fetch_stations() -> list[StationSchema]:
     async with httpx.AsyncClient() as client:
         response = await client.get(API_URL)
         response.raise_for_status()
-        stations = extract_relevant_data(response.json())
-        logger.debug(f"Retrieved data for {len(stations)} stations from API")
+        stations = extract_relevant_data(response.content)
+        logger.debug("Retrieved data for %d stations from API", len(stations))
 
         return stations
 
 
-def add_new_station(session: AsyncSession, station: StationSchema):
-    new_station = StationModel(
-        uid=station.uid, name=station.name, lat=station.lat, lng=station.lng
-    )
-    session.add(new_station)
-
-    cache_service.station_uids.add(station.uid)
-
-    logger.info(f"Added new station: {station.uid}")
+def create_station_row(station: StationSchema) -> dict:
+    return {
+        "uid": station.uid,
+        "name": station.name,
+        "lat": station.lat,
+        "lng": station.lng,
+    }
 
 
-def add_new_bike(
-    session: AsyncSession,
+def create_bike_row(
     bike: BikeSchema,
     station: StationSchema,
     current_time: datetime,
-):
-    new_bike = BikeModel(
-        number=bike.number, timestamp=current_time, station_uid=station.uid
-    )
-    session.add(new_bike)
+) -> dict:
+    return {
+        "number": bike.number,
+        "timestamp": current_time,
+        "station_uid": station.uid,
+    }
 
-    cache_service.bike_station[bike.number] = station.uid
 
-    logger.info(f"Bike {bike.number} moved to {station.uid}")
-
-
-def process_bikes(session: AsyncSession, station: StationSchema):
+def process_bikes(station: StationSchema) -> list[dict]:
     current_time = datetime.now(UTC).replace(tzinfo=None)
-    for bike in station.bike_list:
-        if cache_service.has_bike_moved(bike, station):
-            add_new_bike(session, bike, station, current_time)
+    return [
+        create_bike_row(bike, station, current_time)
+        for bike in station.bike_list
+        if cache_service.has_bike_moved(bike, station)
+    ]
 
 
-def process_stations(session: AsyncSession, stations: list[StationSchema]):
+def process_stations(stations: list[StationSchema]) -> tuple[list[dict], list[dict]]:
+    station_rows = {}
+    bike_rows = []
     for station in stations:
         # Bikes outside stations are included in the places list.
         # The "spot" attribute for these are false
@@ -81,27 +81,63 @@ def process_stations(session: AsyncSession, stations: list[StationSchema]):
 
         # Create new station if it doesn't exist
         if station.uid not in cache_service.station_uids:
-            add_new_station(session, station)
+            station_rows[station.uid] = create_station_row(station)
 
         # Save bikes
-        process_bikes(session, station)
+        bike_rows.extend(process_bikes(station))
+
+    return list(station_rows.values()), bike_rows
+
+
+def update_cache(station_rows: list[dict], bike_rows: list[dict]):
+    # Only called once the rows are committed, so a failed tick
+    # is detected again on the next one
+    for row in station_rows:
+        cache_service.station_uids.add(row["uid"])
+        logger.info("Added new station: %s", row["uid"])
+
+    for row in bike_rows:
+        cache_service.bike_station[row["number"]] = row["station_uid"]
+        logger.info("Bike %s moved to %s", row["number"], row["station_uid"])
+
+
+def upsert_stations_statement():
+    statement = pg_insert(StationModel)
+    return statement.on_conflict_do_update(
+        index_elements=[StationModel.uid],
+        set_={
+            "name": statement.excluded.name,
+            "lat": statement.excluded.lat,
+            "lng": statement.excluded.lng,
+        },
+    )
+
+
+async def save_rows(
+    session: AsyncSession, station_rows: list[dict], bike_rows: list[dict]
+):
+    # Stations go first so the foreign keys of the new bike rows are satisfied
+    if station_rows:
+        await session.execute(upsert_stations_statement(), station_rows)
+    if bike_rows:
+        await session.execute(insert(BikeModel), bike_rows)
 
 
 async def query_api_and_save():
     try:
         logger.debug("Starting API query and data save process")
 
-        async with AsyncSessionLocal() as session:
-            stations = await fetch_stations()
-            process_stations(session, stations)
+        stations = await fetch_stations()
+        station_rows, bike_rows = process_stations(stations)
+
+        # One transaction per tick, committed on exit and rolled back on error
+        async with AsyncSessionLocal() as session, session.begin():
+            await save_rows(session, station_rows, bike_rows)
 
-            await session.commit()
-            logger.debug("Data saved successfully")
+        update_cache(station_rows, bike_rows)
+        logger.debug("Data saved successfully")
     except Exception as e:
-        logger.error(f"Error in query_api_and_save: {e}", exc_info=True)
-        await session.rollback()
-    finally:
-        await session.close()
+        logger.error("Error in query_api_and_save: %s", e, exc_info=True)
 
 
 async def main():
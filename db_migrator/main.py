@@ -1,7 +1,10 @@
 import asyncio
 import os
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+from sqlalchemy.schema import CreateIndex
 
 from shared.logger import setup_logger
 from shared.models import Base
@@ -10,19 +13,34 @@ logger = setup_logger("db_migrator", "db_migrator.log")
 
 DATABASE_URL = os.getenv("DATABASE_URL")
 
+# Single-column indexes replaced by the composite ones on BikeModel
+DROP_LEGACY_INDEXES = text(
+    "DROP INDEX IF EXISTS ix_bikes_number, ix_bikes_timestamp, ix_bikes_station_uid"
+)
+
 
 async def run_migrations():
     logger.info("Starting database migrations")
-    engine = create_async_engine(DATABASE_URL, echo=True)
+    engine = create_async_engine(DATABASE_URL, echo=True, poolclass=NullPool)
 
     try:
         async with engine.begin() as conn:
             logger.info("Creating database schema")
             await conn.run_sync(Base.metadata.create_all)
 
+            # create_all skips tables that already exist along with their
+            # indexes, so indexes added later are created here
+            logger.info("Creating missing indexes")
+            for table in Base.metadata.sorted_tables:
+                for index in table.indexes:
+                    await conn.execute(CreateIndex(index, if_not_exists=True))
+
+            logger.info("Dropping legacy indexes")
+            await conn.execute(DROP_LEGACY_INDEXES)
+
         logger.info("Database migrations completed successfully")
     except Exception as e:
-        logger.error(f"Error during database migration: {e}")
+        logger.error("Error during database migration: %s", e)
         raise
     finally:
         await engine.dispose()
@@ -2,8 +2,7 @@ import asyncio
 import os
 
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
 from .logger import setup_logger
 
@@ -11,25 +10,34 @@ logger = setup_logger("database", "database.log")
 
 DATABASE_URL = os.getenv("DATABASE_URL")
 
-engine = create_async_engine(DATABASE_URL, echo=False)
+engine = create_async_engine(
+    DATABASE_URL, echo=False, pool_pre_ping=True, pool_recycle=1800
+)
 
 
-async def wait_for_db(max_retries=5, retry_interval=2):
+async def _ping_db():
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+
+async def wait_for_db(max_retries=5, retry_interval=2, connect_timeout=2):
     """Wait for database to be ready and accessible"""
     for attempt in range(max_retries):
         try:
-            async with engine.connect() as conn:
-                await conn.execute(text("SELECT 1"))
-                logger.info("Database connection successful")
-                return True
+            await asyncio.wait_for(_ping_db(), timeout=connect_timeout)
+            logger.info("Database connection successful")
+            return True
         except Exception as e:
             logger.warning(
-                f"Database connection attempt {attempt+1}/{max_retries} failed: {e}"
+                "Database connection attempt %d/%d failed: %r",
+                attempt + 1,
+                max_retries,
+                e,
             )
             await asyncio.sleep(retry_interval)
 
-    logger.error(f"Could not connect to database after {max_retries} attempts")
+    logger.error("Could not connect to database after %d attempts", max_retries)
     return False
 
 
-AsyncSessionLocal = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+AsyncSessionLocal = async_sessionmaker(engine, expire_on_commit=False, autoflush=False)
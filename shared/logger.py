@@ -1,28 +1,48 @@
+import atexit
+import functools
 import logging
+import queue
 import sys
-from logging.handlers import TimedRotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 
+formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 
-def setup_logger(name, log_file, level=logging.INFO):
-    """Function to set up a logger with both file and console handlers"""
-    formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    )
 
+@functools.cache
+def _get_console_handler():
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(formatter)
+    return console_handler
+
+
+@functools.cache
+def _get_log_queue(log_file):
+    """Start one listener per log file and return the queue that feeds it"""
     # File handler (rotates daily)
     file_handler = TimedRotatingFileHandler(
         log_file, when="midnight", interval=1, backupCount=7
     )
     file_handler.setFormatter(formatter)
 
-    # Console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(formatter)
+    # The calling thread only merges the message and renders tracebacks,
+    # the final format and the disk I/O happen on the listener thread
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(
+        log_queue, file_handler, _get_console_handler(), respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+
+    return log_queue
+
 
-    # Logger setup
+def setup_logger(name, log_file, level=logging.INFO):
+    """Function to set up a logger with both file and console handlers"""
     logger = logging.getLogger(name)
     logger.setLevel(level)
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+
+    # Calling this again for the same logger must not duplicate its output
+    if not logger.handlers:
+        logger.addHandler(QueueHandler(_get_log_queue(log_file)))
 
     return logger
@@ -24,8 +24,13 @@ class BikeModel(Base):
     __tablename__ = "bikes"
 
     id = Column(Integer, primary_key=True)
-    number = Column(String, index=True)
-    timestamp = Column(DateTime, default=datetime.now(UTC), index=True)
-    station_uid = Column(Integer, ForeignKey("stations.uid"), index=True)
+    number = Column(String)
+    timestamp = Column(DateTime, default=lambda: datetime.now(UTC).replace(tzinfo=None))
+    station_uid = Column(Integer, ForeignKey("stations.uid"))
 
     station = relationship("StationModel", back_populates="bikes")
+
+    __table_args__ = (
+        Index("idx_bike_number_timestamp", number, timestamp),
+        Index("idx_bike_station_timestamp", station_uid, timestamp),
+    )